@@ -441,6 +441,18 @@ class CalculationOutput:
 
         return None
 
+    @property
+    def file_lines(self):
+        """Lines of the output file"""
+        return self._file_lines
+
+    @file_lines.setter
+    def file_lines(self, lines):
+        """Set the output file lines, resetting any properties parsed from
+        the previous lines"""
+        self._file_lines = lines
+        self.properties = None
+
     def exists(self):
         """Does the calculation output exist?"""
 
@@ -452,6 +464,10 @@ class CalculationOutput:
     def __init__(self):
 
         self.filename = None
+
+        # Properties parsed from the file lines by the method, if it caches
+        # them, which are reset when the lines are set
+        self.properties = None
         self.file_lines = None
 
 
@@ -148,7 +148,10 @@ def get_atoms_rotated_stereocentres(species, atoms, rand):
         theta = 2*np.pi*rand.rand()
         idxs_to_rotate = left_idxs if i in left_idxs else right_idxs
 
-        [atoms[n].rotate(axis=rot_axis, theta=theta, origin=atoms[i].coord) for n in idxs_to_rotate if n != i]
+        for n in idxs_to_rotate:
+            if n != i:
+                atoms[n].rotate(axis=rot_axis, theta=theta,
+                                origin=atoms[i].coord)
 
     return atoms
 
@@ -362,10 +365,13 @@ def get_simanl_atoms(species, dist_consts=None, conf_n=0):
 
     if initial_coords_are_reasonable:
         factor = Config.max_atom_displacement / np.sqrt(3)
-        [atom.translate(vec=factor * rand.uniform(-1, 1, 3)) for i, atom in enumerate(atoms) if i not in fixed_atom_indexes]
+        for i, atom in enumerate(atoms):
+            if i not in fixed_atom_indexes:
+                atom.translate(vec=factor * rand.uniform(-1, 1, 3))
     else:
         # Randomise in a 10 Å cubic box
-        [atom.translate(vec=rand.uniform(-5, 5, 3)) for atom in atoms]
+        for atom in atoms:
+            atom.translate(vec=rand.uniform(-5, 5, 3))
 
     logger.info('Minimising species...')
     st = time()
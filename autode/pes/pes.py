@@ -1,5 +1,6 @@
 from abc import ABC
 from abc import abstractmethod
+from copy import copy
 from copy import deepcopy
 import itertools
 import numpy as np
@@ -90,7 +91,10 @@ def get_point_species(point, species, distance_constraints, name, method,
     logger.info(f'Calculating point {point} on PES surface')
 
     species.name = f'{name}_scan_{"-".join([str(p) for p in point])}'
-    original_species = deepcopy(species)
+
+    # Optimising the species reassigns, rather than modifies, the atoms and
+    # energy so a shallow copy is sufficient to retain the original
+    original_species = copy(species)
 
     # Set up and run the calculation
     const_opt = Calculation(name=species.name, molecule=species, method=method,
@@ -106,9 +110,15 @@ def get_point_species(point, species, distance_constraints, name, method,
 
     # If the energy difference is > 1 Hartree then likely something has gone
     # wrong with the EST method we need to be not on the first point to compute
-    # an energy difference..
+    # an energy difference.. and the starting structure must have an energy,
+    # which the interpolated initial structures on a 1D surface do not
     if not all(p == 0 for p in point):
-        if species.energy is None or np.abs(original_species.energy - species.energy) > energy_threshold:
+        if species.energy is None:
+            logger.error('PES point had no energy. Using the closest')
+            return original_species
+
+        if (original_species.energy is not None
+                and np.abs(original_species.energy - species.energy) > energy_threshold):
             logger.error(f'PES point had a relative energy '
                          f'> {energy_threshold} Ha. Using the closest')
             return original_species
@@ -1,5 +1,6 @@
-from copy import deepcopy
+from copy import copy
 import numpy as np
+from autode.atoms import Atom
 from autode.exceptions import FitFailed
 from autode.transition_states.ts_guess import get_ts_guess
 from autode.config import Config
@@ -7,36 +8,106 @@ from autode.log import logger
 from autode.mol_graphs import is_isomorphic
 from autode.mol_graphs import make_graph
 from autode.plotting import plot_1dpes
-from autode.pes.pes import get_closest_species
 from autode.pes.pes import get_point_species
 from autode.pes.pes import PES
 from autode.units import KcalMol
+from autode.utils import cached_on_disk
+from autode.utils import NoDaemonPool
 from autode.utils import work_in
 
+try:
+    from numba import njit
+
+except ModuleNotFoundError:
+    njit = None
+
+
+def get_prominent_peaks_numpy(energies, h_star, d_star):
+    """
+    Get the indexes of the peaks in a 1D array of energies that are at least
+    h_star above the lowest energy within d_star points of them
+
+    Arguments:
+        energies (np.ndarray): shape = (n_points,)
+        h_star (float): Minimum prominence of a peak
+        d_star (int): Number of points either side of a peak to consider
+
+    Returns:
+        (np.ndarray): Peak indexes
+    """
+    # Peaks have lower energies both sides of them, so the sign of the
+    # difference between consecutive points changes from + to -
+    diff_signs = np.sign(np.diff(energies))
+    peaks = np.flatnonzero((diff_signs[:-1] > 0) & (diff_signs[1:] < 0)) + 1
+
+    # Exclude peaks that may arise from numerical noise on the surface
+    return np.array([p for p in peaks
+                     if energies[p] - np.min(energies[max(0, p - d_star):p + d_star + 1]) > h_star],
+                    dtype=np.int64)
+
+
+def get_prominent_peaks_loop(energies, h_star, d_star):
+    """
+    Equivalent to get_prominent_peaks_numpy written as explicit loops, to be
+    compiled with numba
+    """
+    n_points = energies.shape[0]
+    peaks = np.zeros(n_points, dtype=np.int64)
+    n_peaks = 0
+
+    for i in range(1, n_points - 1):
+        if not (energies[i] - energies[i-1] > 0
+                and energies[i+1] - energies[i] < 0):
+            continue
+
+        min_energy = energies[i]
+        for j in range(max(0, i - d_star), min(n_points, i + d_star + 1)):
+            min_energy = min(min_energy, energies[j])
+
+        if energies[i] - min_energy > h_star:
+            peaks[n_peaks] = i
+            n_peaks += 1
+
+    return peaks[:n_peaks]
+
+
+# Use a compiled version of the peak finding if numba is available
+if njit is not None:
+    get_prominent_peaks = njit(cache=True)(get_prominent_peaks_loop)
+
+else:
+    get_prominent_peaks = get_prominent_peaks_numpy
+
 
 class PES1d(PES):
 
-    def get_species_saddle_point(self):
+    def get_species_saddle_point(self, h_star=0.0, d_star=1):
         """Get the possible first order saddle points, which are just the
-        peaks in the PES"""
+        peaks in the PES that are sufficiently prominent
+
+        Keyword Arguments:
+            h_star (float): Minimum height (Ha) of a peak above the lowest
+                            point within d_star points of it
+            d_star (int): Number of points either side of a peak to consider
+        """
         energies = [self.species[i].energy for i in range(self.n_points)]
 
         if any(energy is None for energy in energies):
             raise FitFailed
 
-        # Peaks have lower energies both sides of them
-        peaks = [i for i in range(1, self.n_points - 1) if energies[i-1] < energies[i] and energies[i+1] < energies[i]]
+        energies = np.array(energies, dtype=np.float64)
+        peaks = get_prominent_peaks(energies, float(h_star), int(d_star))
 
         # Yield the peak with the highest energy first
-        for peak in sorted(peaks, key=lambda p: -self.species[p].energy):
+        for peak in peaks[np.argsort(-energies[peaks], kind='stable')]:
             yield self.species[peak]
 
         return None
 
     def print_plot(self, method_name, name='PES1d'):
         """Print a 1D surface using matplotlib"""
-        min_energy = min([species.energy for species in self.species])
-        rel_energies = [KcalMol.conversion * (species.energy - min_energy) for species in self.species]
+        energies = np.array([species.energy for species in self.species])
+        rel_energies = KcalMol.conversion * (energies - energies.min())
 
         return plot_1dpes(self.rs, rel_energies, name=name, method_name=method_name)
 
@@ -52,24 +123,103 @@ class PES1d(PES):
 
         return False
 
-    @work_in('pes1d')
-    def calculate(self, name, method, keywords):
-        """Calculate all the points on the surface in serial using the maximum
-         number of cores available"""
+    def _get_initial_species(self):
+        """
+        Generate starting structures for all the points on the surface by
+        linearly displacing both atoms in the scanned bond from the first
+        point along the bond vector, so r = rs[i] for point i
+
+        Returns:
+            (list(autode.species.Species)):
+        """
+        labels = [atom.label for atom in self.species[0].atoms]
+        coords = self.species[0].get_coordinates()
+        idx_i, idx_j = self.rs_idxs[0]
+
+        vec = coords[idx_j] - coords[idx_i]
+        curr_dist = np.linalg.norm(vec)
+
+        # Shift each atom by half the required change in the distance, for
+        # all points at once. shape = (n_points, 3)
+        shifts = np.outer(0.5 * (self.rs[:, 0] - curr_dist), vec / curr_dist)
+
+        all_coords = np.repeat(coords[np.newaxis, :, :], self.n_points, axis=0)
+        all_coords[:, idx_i] -= shifts
+        all_coords[:, idx_j] += shifts
+
+        initial_species = []
+        for point_coords in all_coords.tolist():
+
+            # Only the atoms are modified, so there is no need to copy the
+            # rest of the species. The energy and graph of the first point do
+            # not apply to an interpolated structure, so a point that fails
+            # to optimise has no energy
+            species = copy(self.species[0])
+            species.atoms = [Atom(label, *coord)
+                             for label, coord in zip(labels, point_coords)]
+            species.energy = None
+            species.graph = None
+            initial_species.append(species)
+
+        return initial_species
+
+    def _fill_failed_points(self):
+        """
+        Replace any points on the surface that failed to optimise, and so have
+        no energy, with the closest point that did. The previous point is
+        used if two are equally close, as in a sequential scan
+        """
+        succeeded = [i for i in range(self.n_points)
+                     if self.species[i].energy is not None]
+
+        if len(succeeded) == 0:
+            logger.error('No points on the 1D surface were calculated')
+            return None
 
         for i in range(self.n_points):
-            closest_species = get_closest_species((i,), self)
-
-            # Set up the dictionary of distance constraints keyed with bond
-            # indexes and values the current r1, r2.. value
-            distance_constraints = {self.rs_idxs[0]: self.rs[i][0]}
-
-            self.species[i] = get_point_species((i,), closest_species,
-                                                distance_constraints,
-                                                name,
-                                                method,
-                                                keywords,
-                                                Config.n_cores)
+            if self.species[i].energy is not None:
+                continue
+
+            closest = min(succeeded, key=lambda j: (abs(i - j), j))
+            logger.warning(f'Point {i} on the 1D surface failed. Using the '
+                           f'closest, point {closest}')
+            self.species[i] = copy(self.species[closest])
+
+        return None
+
+    @work_in('pes1d')
+    def calculate(self, name, method, keywords):
+        """Calculate all the points on the surface in parallel. Each point is
+        initialised from a linear interpolation along the scanned bond so the
+        constrained optimisations are independent"""
+        logger.info(f'Running a 1D PES scan with {method.name}. '
+                    f'{self.n_points} total points')
+
+        initial_species = self._get_initial_species()
+
+        # The cores for each calculation are the floored number of total cores
+        # divided by the number of calculations
+        cores_per_process = max(Config.n_cores // self.n_points, 1)
+
+        # Set up the dictionaries of distance constraints keyed with bond
+        # indexes and values the current r1 value
+        distance_constraints = [{self.rs_idxs[0]: self.rs[i][0]}
+                                for i in range(self.n_points)]
+
+        # Use custom NoDaemonPool here, as there are several
+        # multiprocessing events happening within the function
+        with NoDaemonPool(processes=Config.n_cores) as pool:
+            results = [pool.apply_async(func=get_point_species,
+                                        args=((i,), s, d, name, method,
+                                              keywords, cores_per_process))
+                       for i, (s, d) in enumerate(zip(initial_species,
+                                                      distance_constraints))]
+
+            for i in range(self.n_points):
+                self.species[i] = results[i].get(timeout=None)
+
+        self._fill_failed_points()
+        logger.info('1D PES scan done')
         return None
 
     def __init__(self, reactant, product, rs, r_idxs):
@@ -87,7 +237,9 @@ class PES1d(PES):
 
         # Vector to store the species
         self.species = np.empty(shape=(self.n_points,), dtype=object)
-        self.species[0] = deepcopy(reactant)
+        # Shallow copy of the reactant, as the atoms are copied for each point
+        # on the surface and attributes on the species are only reassigned
+        self.species[0] = copy(reactant)
 
         # Tuple of the atom indices scanned in coordinate r
         self.rs_idxs = [r_idxs]
@@ -97,7 +249,47 @@ class PES1d(PES):
         self.product_graph = product.graph
 
 
-def get_ts_guess_1d(reactant, product, bond, name, method, keywords, dr=0.1):
+def get_species_key(species):
+    """
+    Get a key that identifies a species from its atoms, charge, multiplicity
+    and solvent, with the coordinates rounded to 1e-6 Å
+
+    Arguments:
+        species (autode.species.Species):
+
+    Returns:
+        (tuple):
+    """
+    labels = tuple(atom.label for atom in species.atoms)
+    solvent_name = None if species.solvent is None else species.solvent.name
+
+    # Adding zero converts any -0.0 to 0.0, which have different bytes
+    coords = np.round(species.get_coordinates(), decimals=6) + 0.0
+
+    return (labels, coords.tobytes(), species.charge, species.mult,
+            solvent_name)
+
+
+def get_scan_key(reactant, product, bond, name, method, keywords, dr=0.1,
+                 h_star=0.0, d_star=1):
+    """Key for a 1D scan with the same arguments as get_ts_guess_1d"""
+    product_edges = tuple(sorted(tuple(sorted(edge))
+                                 for edge in product.graph.edges))
+
+    # Attributes of the method that change the result of a calculation, as
+    # well as the keywords
+    method_key = (method.__name__, method.name, method.path,
+                  method.implicit_solvation_type)
+
+    return (get_species_key(reactant), get_species_key(product),
+            product_edges, tuple(bond.atom_indexes), repr(bond.final_dist),
+            name, method_key, str(keywords), repr(dr), repr(h_star),
+            repr(d_star))
+
+
+@cached_on_disk(key_func=get_scan_key)
+def get_ts_guess_1d(reactant, product, bond, name, method, keywords, dr=0.1,
+                    h_star=0.0, d_star=1):
     """Scan the distance between two atoms and return a guess for the TS
 
     Arguments:
@@ -111,15 +303,38 @@ def get_ts_guess_1d(reactant, product, bond, name, method, keywords, dr=0.1):
     Keyword Arguments:
         dr (float): Δr on the surface *absolute value* in angstroms
 
+        h_star (float): Minimum prominence (Ha) of a peak on the surface for
+                        it to be considered a saddle point. Default is 0, so
+                        all peaks are considered
+
+        d_star (int): Number of points either side of a peak over which its
+                      prominence is calculated
+
     Returns:
         (autode.transition_states.ts_guess.TSguess): TS guess
     """
     logger.info(f'Getting TS guess from 1D relaxed potential energy scan using '
                 f'{bond.atom_indexes} as the active bond')
 
+    if reactant.n_atoms < 2:
+        logger.warning('Cannot scan a distance with fewer than two atoms')
+        return None
+
+    if not np.isfinite(bond.curr_dist) or not np.isfinite(bond.final_dist):
+        logger.warning('Scanned bond had a non-finite distance')
+        return None
+
+    rs = np.arange(bond.curr_dist, bond.final_dist,
+                   step=dr if bond.final_dist > bond.curr_dist else -dr)
+
+    # A peak requires at least one point with a neighbour on either side
+    if len(rs) < 3:
+        logger.warning(f'Cannot find a peak on a surface with {len(rs)} '
+                       f'point(s)')
+        return None
+
     # Create a potential energy surface in the active bonds and calculate
-    pes = PES1d(reactant=reactant, product=product,
-                rs=np.arange(bond.curr_dist, bond.final_dist, step=dr if bond.final_dist > bond.curr_dist else -dr),
+    pes = PES1d(reactant=reactant, product=product, rs=rs,
                 r_idxs=bond.atom_indexes)
 
     pes.calculate(name=name, method=method, keywords=keywords)
@@ -133,7 +348,8 @@ def get_ts_guess_1d(reactant, product, bond, name, method, keywords, dr=0.1):
 
     try:
         # May want to iterate through all saddle points not just the highest(?)
-        for species in pes.get_species_saddle_point():
+        for species in pes.get_species_saddle_point(h_star=h_star,
+                                                    d_star=d_star):
             return get_ts_guess(species=species, reactant=reactant, product=product, name=name)
 
     except FitFailed:
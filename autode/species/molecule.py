@@ -1,4 +1,6 @@
+from copy import deepcopy
 from multiprocessing import Pool
+from rdkit import Chem
 from rdkit.Chem import AllChem
 from autode.input_output import xyz_file_to_atoms
 from autode.conformers.conformer import Conformer
@@ -17,6 +19,26 @@ from autode.utils import requires_atoms
 
 class Molecule(Species):
 
+    def __deepcopy__(self, memo):
+        """Deep copy this molecule, using the RDKit copy constructor for the
+        RDKit molecule and copying the graph directly, both of which are much
+        faster than the generic recursive deepcopy"""
+        new_molecule = self.__class__.__new__(self.__class__)
+        memo[id(self)] = new_molecule
+
+        for attr, value in self.__dict__.items():
+
+            if attr == 'rdkit_mol_obj' and value is not None:
+                new_molecule.rdkit_mol_obj = Chem.Mol(value)
+
+            elif attr == 'graph' and value is not None:
+                new_molecule.graph = value.copy()
+
+            else:
+                setattr(new_molecule, attr, deepcopy(value, memo))
+
+        return new_molecule
+
     def _init_smiles(self, smiles):
         """Initialise a molecule from a SMILES string using RDKit if it's
         purely organic"""
@@ -1,5 +1,7 @@
 from functools import wraps
+from hashlib import sha1
 import os
+import pickle
 import shutil
 from subprocess import Popen, DEVNULL, PIPE, STDOUT
 from tempfile import mkdtemp
@@ -91,6 +93,61 @@ def work_in(dir_ext):
     return func_decorator
 
 
+def cached_on_disk(key_func):
+    """
+    Cache the result of a function as a pickle file in $AUTODE_CACHE_DIR, if
+    it is set. The file is named from a hash of the key returned by
+    key_func(*args, **kwargs) and the autode version, so results from
+    different versions of autode are never reused. None is not cached, so a
+    function that failed is run again
+    """
+
+    def func_decorator(func):
+
+        @wraps(func)
+        def wrapped_function(*args, **kwargs):
+
+            if 'AUTODE_CACHE_DIR' not in os.environ:
+                return func(*args, **kwargs)
+
+            # Imported here to prevent a circular import
+            from autode import __version__
+
+            key = repr((__version__, key_func(*args, **kwargs)))
+            cache_dir = os.path.abspath(os.environ['AUTODE_CACHE_DIR'])
+            filepath = os.path.join(cache_dir, f'{func.__name__}_'
+                                               f'{sha1(key.encode()).hexdigest()}.pkl')
+
+            if os.path.exists(filepath):
+                try:
+                    with open(filepath, 'rb') as cache_file:
+                        logger.info(f'Using cached result in {filepath}')
+                        return pickle.load(cache_file)
+
+                except (pickle.UnpicklingError, EOFError, AttributeError):
+                    logger.warning(f'Could not load {filepath}. Recomputing')
+
+            result = func(*args, **kwargs)
+
+            if result is None:
+                return None
+
+            if not os.path.isdir(cache_dir):
+                logger.info(f'Creating directory to cache results: {cache_dir}')
+                os.makedirs(cache_dir, exist_ok=True)
+
+            # Write then move, so a partially written file is never loaded
+            tmp_filepath = f'{filepath}.{os.getpid()}.tmp'
+            with open(tmp_filepath, 'wb') as cache_file:
+                pickle.dump(result, cache_file)
+
+            os.replace(tmp_filepath, filepath)
+            return result
+
+        return wrapped_function
+    return func_decorator
+
+
 def work_in_tmp_dir(filenames_to_copy, kept_file_exts):
     """Execute a function in a temporary directory.
 
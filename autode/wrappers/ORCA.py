@@ -1,5 +1,9 @@
 import numpy as np
+import io
 import os
+import re
+import warnings
+from types import MappingProxyType
 from autode.constants import Constants
 from autode.utils import run_external
 from autode.wrappers.base import ElectronicStructureMethod
@@ -10,10 +14,23 @@ from autode.exceptions import NoCalculationOutput
 from autode.utils import work_in_tmp_dir
 from autode.log import logger
 
-vdw_gaussian_solvent_dict = {'water': 'Water', 'acetone': 'Acetone', 'acetonitrile': 'Acetonitrile', 'benzene': 'Benzene',
-                             'carbon tetrachloride': 'CCl4', 'dichloromethane': 'CH2Cl2', 'chloroform': 'Chloroform', 'cyclohexane': 'Cyclohexane',
-                             'n,n-dimethylformamide': 'DMF', 'dimethylsulfoxide': 'DMSO', 'ethanol': 'Ethanol', 'n-hexane': 'Hexane',
-                             'methanol': 'Methanol', '1-octanol': 'Octanol', 'pyridine': 'Pyridine', 'tetrahydrofuran': 'THF', 'toluene': 'Toluene'}
+vdw_gaussian_solvent_dict = MappingProxyType({'water': 'Water', 'acetone': 'Acetone', 'acetonitrile': 'Acetonitrile', 'benzene': 'Benzene',
+                                              'carbon tetrachloride': 'CCl4', 'dichloromethane': 'CH2Cl2', 'chloroform': 'Chloroform', 'cyclohexane': 'Cyclohexane',
+                                              'n,n-dimethylformamide': 'DMF', 'dimethylsulfoxide': 'DMSO', 'ethanol': 'Ethanol', 'n-hexane': 'Hexane',
+                                              'methanol': 'Methanol', '1-octanol': 'Octanol', 'pyridine': 'Pyridine', 'tetrahydrofuran': 'THF', 'toluene': 'Toluene'})
+
+
+termination_strings = (b'ORCA TERMINATED NORMALLY',
+                       b'The optimization did not converge')
+
+# Strings that mark the start of a section in the output that is parsed
+output_anchors = re.compile(b'|'.join(re.escape(string) for string in (
+    b'FINAL SINGLE POINT ENERGY', b'Total Enthalpy',
+    b'Final Gibbs free energy', b'Final Gibbs free enthalpy',
+    b'THE OPTIMIZATION HAS CONVERGED', b'Geometry convergence',
+    b'The optimization has not yet converged', b'VIBRATIONAL FREQUENCIES',
+    b'NORMAL MODES', b'IR SPECTRUM', b'HIRSHFELD ANALYSIS',
+    b'CARTESIAN GRADIENT')))
 
 
 def use_vdw_gaussian_solvent(keywords, implicit_solv_type):
@@ -45,17 +62,22 @@ def add_solvent_keyword(calc_input, keywords, implicit_solv_type):
     if implicit_solv_type.lower() not in ['smd', 'cpcm']:
         raise UnsuppportedCalculationInput
 
-    # Use CPCM solvation
-    if (use_vdw_gaussian_solvent(keywords, implicit_solv_type)
-            and calc_input.solvent not in vdw_gaussian_solvent_dict.keys()):
+    solvent = vdw_gaussian_solvent_dict.get(calc_input.solvent)
+
+    if solvent is not None:
+        # Use CPCM solvation
+        keywords.append(f'CPCM({solvent})')
+        return
 
-        err = (f'CPCM solvent with gaussian charge not avalible for '
+    if implicit_solv_type.lower() == 'cpcm':
+        err = (f'CPCM solvent not avalible for '
                f'{calc_input.solvent}.Available solvents are '
-               f'{vdw_gaussian_solvent_dict.keys()}')
+               f'{list(vdw_gaussian_solvent_dict)}')
 
         raise UnsuppportedCalculationInput(message=err)
 
-    keywords.append(f'CPCM({vdw_gaussian_solvent_dict[calc_input.solvent]})')
+    # SMD solvents are set in the %cpcm block
+    keywords.append('CPCM')
     return
 
 
@@ -63,12 +85,16 @@ def get_keywords(calc_input, molecule, implicit_solv_type):
     """Modify the keywords for this calculation with the solvent + fix for
     single atom optimisation calls"""
 
-    keywords = calc_input.keywords.copy()
+    keywords = []
 
-    for keyword in keywords:
+    # Build a new list in one pass rather than removing from a list while
+    # iterating over it, which skips the keyword after a removed one
+    for keyword in calc_input.keywords:
         if 'opt' in keyword.lower() and molecule.n_atoms == 1:
             logger.warning('Can\'t optimise a single atom')
-            keywords.remove(keyword)  # ORCA defaults to a SP calc
+            continue  # ORCA defaults to a SP calc
+
+        keywords.append(keyword)
 
     if calc_input.solvent is not None:
         add_solvent_keyword(calc_input, keywords, implicit_solv_type)
@@ -147,6 +173,24 @@ def print_increased_optimisation_steps(inp_file, molecule, calc_input):
     return
 
 
+def format_block(row_format, columns):
+    """
+    Format a block of rows using a single string formatting operation over
+    all the values, rather than formatting each row in turn
+
+    Arguments:
+        row_format (str): printf-style format of a single row
+        columns (list(list)): Values in each column, all of the same length
+
+    Returns:
+        (str):
+    """
+    rows = list(zip(*columns))
+    values = tuple(value for row in rows for value in row)
+
+    return (row_format * len(rows)) % values
+
+
 def print_point_charges(inp_file, calc_input):
     """Print a point charge file and add the name to the input file"""
 
@@ -154,12 +198,14 @@ def print_point_charges(inp_file, calc_input):
         return
 
     filename = calc_input.filename.replace('.inp', '.pc')
+
+    charges = [pc.charge for pc in calc_input.point_charges]
+    coords = np.array([pc.coord for pc in calc_input.point_charges])
+    pc_lines = format_block('%12.8f %12.8f %12.8f %12.8f\n',
+                            columns=[charges, *coords.T.tolist()])
+
     with open(filename, 'w') as pc_file:
-        print(len(calc_input.point_charges), file=pc_file)
-        for pc in calc_input.point_charges:
-            x, y, z = pc.coord
-            print(f'{pc.charge:^12.8f} {x:^12.8f} {y:^12.8f} {z:^12.8f}',
-                  file=pc_file)
+        pc_file.write(f'{len(calc_input.point_charges)}\n{pc_lines}')
 
     calc_input.additional_filenames.append(filename)
 
@@ -180,12 +226,14 @@ def print_default_params(inp_file):
 def print_coordinates(inp_file, molecule):
     """Print the coordinates to the input file in the correct format"""
 
-    print('*xyz', molecule.charge, molecule.mult, file=inp_file)
-    for atom in molecule.atoms:
-        x, y, z = atom.coord
-        print(f'{atom.label:<3} {x:^12.8f} {y:^12.8f} {z:^12.8f}',
-              file=inp_file)
-    print('*', file=inp_file)
+    labels = [atom.label for atom in molecule.atoms]
+    coord_lines = format_block('%-3s %12.8f %12.8f %12.8f\n',
+                               columns=[labels,
+                                        *molecule.get_coordinates().T.tolist()])
+
+    inp_file.write(f'*xyz {molecule.charge} {molecule.mult}\n'
+                   f'{coord_lines}'
+                   f'*\n')
 
     return
 
@@ -218,6 +266,321 @@ def calc_atom_entropy(atom_label, temp):
     return s / (Constants.ha2kJmol * 1000)
 
 
+def float_or_none(string):
+    """Convert a string to a float, or None if that's not possible"""
+    try:
+        return float(string)
+
+    except ValueError:
+        return None
+
+
+def parse_block(lines, func):
+    """
+    Apply a function to every line in a block of the output, returning an
+    empty list if any line cannot be parsed e.g. the block is truncated
+
+    Arguments:
+        lines (list(str)):
+        func (function): Function to apply to each line
+
+    Returns:
+        (list):
+    """
+    try:
+        return [func(line) for line in lines]
+
+    except (IndexError, ValueError):
+        return []
+
+
+def get_lines(buffer, pos, first, n_lines):
+    """
+    Get a number of lines from a buffer relative to the line containing a
+    position, without splitting the whole buffer
+
+    Arguments:
+        buffer (bytes):
+        pos (int): Position within the anchor line
+        first (int): Index of the first line relative to the anchor line
+        n_lines (int): Number of lines to return
+
+    Returns:
+        (list(str)):
+    """
+    start = buffer.rfind(b'\n', 0, pos) + 1
+
+    for _ in range(first):
+        start = buffer.find(b'\n', start) + 1
+        if start == 0:
+            return []
+
+    end = start
+    for _ in range(n_lines):
+        end = buffer.find(b'\n', end) + 1
+        if end == 0:
+            end = len(buffer)
+            break
+
+    return buffer[start:end].decode().splitlines()
+
+
+def get_line(buffer, pos):
+    """Get the line in a buffer containing a position"""
+    return get_lines(buffer, pos, first=0, n_lines=1)[0]
+
+
+def get_gradient_vector(line):
+    """
+    Get the gradient vector from a line of the gradient block e.g.::
+
+       1   C   :   -0.011390275   -0.000447412    0.000552736
+
+    Arguments:
+        line (str):
+
+    Returns:
+        (list(float)):
+    """
+    items = line.split()
+    return [float(items[-3]), float(items[-2]), float(items[-1])]
+
+
+def get_normal_modes(lines, n_atoms):
+    """
+    Get the normal mode displacements from the lines in a NORMAL MODES
+    section, which contains blocks of 3 x n_atoms rows with a column for each
+    mode::
+
+                      0          1          2          3          4   ...
+          0       0.000000   0.000000   0.000000   0.000000   0.000000
+          .          .          .          .          .          .
+
+    Arguments:
+        lines (list(str)):
+        n_atoms (int):
+
+    Returns:
+        (dict): Displacements (np.ndarray) keyed with the mode number,
+                each with shape = (3 x n_atoms,)
+    """
+    normal_modes, values_sec = {}, False
+
+    for i, line in enumerate(lines):
+        items = line.split()
+
+        if len(items) > 1 and items[0].startswith('0'):
+            values_sec = True
+
+        if not values_sec or '.' in line or len(items) < 2:
+            continue
+
+        d_lines = lines[i + 1:i + 3 * n_atoms + 1]
+        if len(d_lines) == 0:
+            continue
+
+        # Parse the whole block at once, the first column being the index
+        try:
+            block = np.loadtxt(d_lines, ndmin=2)
+
+        except ValueError:
+            # Not a complete block, so parse the columns individually
+            block = None
+
+        for col, mode_number in enumerate(items, start=1):
+
+            if block is not None and col < block.shape[1]:
+                displacements = block[:, col]
+            else:
+                displacements = np.array(parse_block(
+                    d_lines, lambda l: float(l.split()[col])))
+
+            normal_modes[int(mode_number)] = displacements
+
+    return normal_modes
+
+
+def terminated_normally(buffer, n_lines=32):
+    """
+    Determine if ORCA terminated normally from any of the termination strings
+    being present in the final few lines of an output
+
+    Arguments:
+        buffer (bytes): Output, or just the end of it
+
+    Keyword Arguments:
+        n_lines (int): Number of lines from the end of the buffer to search
+
+    Returns:
+        (bool):
+    """
+    tail_start = len(buffer)
+    for _ in range(n_lines + 1):
+        tail_start = max(buffer.rfind(b'\n', 0, tail_start), 0)
+
+    for string in termination_strings:
+        if buffer.find(string, tail_start) != -1:
+            return True
+
+    return False
+
+
+def get_output_tail(calc, n_lines=128):
+    """
+    Get the final lines of a calculation output, which is sufficient for
+    properties printed close to the end without parsing the whole output
+
+    Arguments:
+        calc (autode.calculation.Calculation):
+
+    Keyword Arguments:
+        n_lines (int): Maximum number of lines
+
+    Returns:
+        (bytes):
+    """
+    return ''.join(calc.output.file_lines[-n_lines:]).encode()
+
+
+def geom_conv_block_has_yes(buffer, start, end):
+    """
+    Determine if any of the geometry convergence criteria in a block of the
+    output are satisfied::
+
+        ----------------------|Geometry convergence|------------------  <- start
+        Item                value                   Tolerance       Converged
+        -----------------------------------------------------------------
+        RMS gradient        0.0134297511            0.0001000000      NO
+        .                       .                        .             .
+
+    Arguments:
+        buffer (bytes):
+        start (int): Position of the start of the block
+        end (int): Position of the end of the block
+
+    Returns:
+        (bool):
+    """
+    # Skip the first line which contains the header
+    for line in buffer[start:end].decode().splitlines()[1:]:
+        items = line.split()
+        if len(items) == 5 and items[-1] == 'YES':
+            return True
+
+    return False
+
+
+def parse_output(buffer, n_atoms):
+    """
+    Extract all the properties from an ORCA output. The buffer is scanned once
+    for all the anchor strings that start a section and only the lines around
+    them are decoded and split. Where a property appears more than once (e.g.
+    the energy in an optimisation) the final value is retained
+
+    Arguments:
+        buffer (bytes): Output file contents
+        n_atoms (int): Number of atoms in the calculated structure
+
+    Returns:
+        (dict): Properties keyed with their name
+    """
+    props = {'terminated_normally': terminated_normally(buffer),
+             'energy': None,
+             'enthalpy': None,
+             'free_energy': None,
+             'converged': False,
+             'nearly_converged': False,
+             'imag_freqs': [],
+             'normal_modes': {},
+             'charges': [],
+             'gradients': []}
+
+    # Final positions of each of the anchors, and the start and end of the
+    # final normal modes section
+    positions = {}
+    normal_modes_start, normal_modes_end = None, None
+
+    for match in output_anchors.finditer(buffer):
+        anchor, pos = match.group(), match.start()
+
+        if anchor == b'NORMAL MODES':
+            normal_modes_start, normal_modes_end = pos, None
+
+        if anchor == b'IR SPECTRUM' and normal_modes_end is None:
+            normal_modes_end = pos
+
+        # Nearly converged if any of the criteria in the block prior to the
+        # optimisation not converging are satisfied
+        if (anchor == b'The optimization has not yet converged'
+                and not props['nearly_converged']):
+            start = positions.get(b'Geometry convergence', 0)
+            props['nearly_converged'] = geom_conv_block_has_yes(buffer,
+                                                                start, pos)
+
+        positions[anchor] = pos
+
+    if b'FINAL SINGLE POINT ENERGY' in positions:
+        line = get_line(buffer, positions[b'FINAL SINGLE POINT ENERGY'])
+        props['energy'] = float(line.split()[4])
+
+    if b'Total Enthalpy' in positions:
+        line = get_line(buffer, positions[b'Total Enthalpy'])
+        props['enthalpy'] = float_or_none(line.split()[-2])
+
+    pos = max(positions.get(b'Final Gibbs free energy', -1),
+              positions.get(b'Final Gibbs free enthalpy', -1))
+    if pos != -1:
+        props['free_energy'] = float_or_none(get_line(buffer, pos).split()[-2])
+
+    if b'THE OPTIMIZATION HAS CONVERGED' in positions:
+        props['converged'] = True
+
+    if b'VIBRATIONAL FREQUENCIES' in positions:
+        freq_lines = get_lines(buffer, positions[b'VIBRATIONAL FREQUENCIES'],
+                               first=5, n_lines=3 * n_atoms)
+        freqs = parse_block(freq_lines, lambda l: float(l.split(None, 2)[1]))
+        props['imag_freqs'] = [freq for freq in freqs if freq < 0]
+
+    if normal_modes_start is not None:
+        end = normal_modes_end if normal_modes_end is not None else len(buffer)
+        lines = buffer[normal_modes_start:end].decode().splitlines()
+        props['normal_modes'] = get_normal_modes(lines, n_atoms)
+
+    if b'HIRSHFELD ANALYSIS' in positions:
+        charge_lines = get_lines(buffer, positions[b'HIRSHFELD ANALYSIS'],
+                                 first=7, n_lines=n_atoms)
+        props['charges'] = parse_block(charge_lines,
+                                       lambda l: float(l.split()[-1]))
+
+    if b'CARTESIAN GRADIENT' in positions:
+        grad_lines = get_lines(buffer, positions[b'CARTESIAN GRADIENT'],
+                               first=3, n_lines=n_atoms)
+        props['gradients'] = parse_block(
+            grad_lines, get_gradient_vector)
+
+    return props
+
+
+def get_output_properties(calc):
+    """
+    Get the dictionary of properties from the output of a calculation. The
+    output lines are parsed once and the result stored on the output, so
+    extracting many properties doesn't parse it again
+
+    Arguments:
+        calc (autode.calculation.Calculation):
+
+    Returns:
+        (dict):
+    """
+    if calc.output.properties is None:
+        buffer = ''.join(calc.output.file_lines).encode()
+        calc.output.properties = parse_output(buffer,
+                                              n_atoms=calc.molecule.n_atoms)
+
+    return calc.output.properties
+
+
 class ORCA(ElectronicStructureMethod):
 
     def generate_input(self, calc, molecule):
@@ -225,28 +588,32 @@ class ORCA(ElectronicStructureMethod):
         keywords = get_keywords(calc.input, molecule,
                                 self.implicit_solvation_type)
 
-        with open(calc.input.filename, 'w') as inp_file:
-            print('!', *keywords, file=inp_file)
+        # Build the whole input in memory and write it to the file at once
+        inp_file = io.StringIO()
+        print('!', *keywords, file=inp_file)
+
+        print_solvent(inp_file, calc.input, keywords,
+                      self.implicit_solvation_type)
+        print_added_internals(inp_file, calc.input)
+        print_distance_constraints(inp_file, molecule)
+        print_cartesian_constraints(inp_file, molecule)
+        print_increased_optimisation_steps(inp_file, molecule, calc.input)
+        print_point_charges(inp_file, calc.input)
+        print_default_params(inp_file)
 
-            print_solvent(inp_file, calc.input, keywords,
-                          self.implicit_solvation_type)
-            print_added_internals(inp_file, calc.input)
-            print_distance_constraints(inp_file, molecule)
-            print_cartesian_constraints(inp_file, molecule)
-            print_increased_optimisation_steps(inp_file, molecule, calc.input)
-            print_point_charges(inp_file, calc.input)
-            print_default_params(inp_file)
+        if calc.input.other_block is not None:
+            print(calc.input.other_block, file=inp_file)
 
-            if calc.input.other_block is not None:
-                print(calc.input.other_block, file=inp_file)
+        if calc.n_cores > 1:
+            print(f'%pal nprocs {calc.n_cores}\nend', file=inp_file)
 
-            if calc.n_cores > 1:
-                print(f'%pal nprocs {calc.n_cores}\nend', file=inp_file)
+        if calc.input.temp is not None:
+            print(f'%freq  Temp {calc.input.temp}\nend', file=inp_file)
 
-            if calc.input.temp is not None:
-                print(f'%freq  Temp {calc.input.temp}\nend', file=inp_file)
+        print_coordinates(inp_file, molecule)
 
-            print_coordinates(inp_file, molecule)
+        with open(calc.input.filename, 'w') as input_file:
+            input_file.write(inp_file.getvalue())
 
         return None
 
@@ -269,44 +636,31 @@ class ORCA(ElectronicStructureMethod):
 
     def calculation_terminated_normally(self, calc):
 
-        termination_strings = ['ORCA TERMINATED NORMALLY',
-                               'The optimization did not converge']
-
-        for n_line, line in enumerate(reversed(calc.output.file_lines)):
-
-            if any(substring in line for substring in termination_strings):
-                logger.info('orca terminated normally')
-                return True
-
-            if n_line > 30:
-                # The above lines are pretty close to the end of the file –
-                # so skip parsing it all
-                return False
+        if terminated_normally(get_output_tail(calc)):
+            logger.info('orca terminated normally')
+            return True
 
         return False
 
     def get_energy(self, calc):
-        for line in reversed(calc.output.file_lines):
-            if 'FINAL SINGLE POINT ENERGY' in line:
-                return float(line.split()[4])
+        tail = get_output_tail(calc)
 
-        return None
+        # The final energy is generally printed close to the end of the file
+        if b'FINAL SINGLE POINT ENERGY' in tail:
+            pos = tail.rfind(b'FINAL SINGLE POINT ENERGY')
+            return float(get_line(tail, pos).split()[4])
+
+        return get_output_properties(calc)['energy']
 
     def get_enthalpy(self, calc):
         """Get the enthalpy (H) from an ORCA calculation output"""
 
-        for line in reversed(calc.output.file_lines):
-            if 'Total Enthalpy' in line:
+        enthalpy = get_output_properties(calc)['enthalpy']
 
-                try:
-                    return float(line.split()[-2])
-
-                except ValueError:
-                    break
-
-        logger.error('Could not get the free energy from the calculation. '
-                     'Was a frequency requested?')
-        return None
+        if enthalpy is None:
+            logger.error('Could not get the free energy from the calculation. '
+                         'Was a frequency requested?')
+        return enthalpy
 
     def get_free_energy(self, calc):
         """Get the Gibbs free energy (G) from an ORCA calculation output"""
@@ -321,107 +675,57 @@ class ORCA(ElectronicStructureMethod):
             # Calculate H - TS, the latter term from Jmol-1 -> Ha
             return h - s * calc.input.temp
 
-        for line in reversed(calc.output.file_lines):
-            if ('Final Gibbs free energy' in line
-                    or 'Final Gibbs free enthalpy' in line):
-
-                try:
-                    return float(line.split()[-2])
+        free_energy = get_output_properties(calc)['free_energy']
 
-                except ValueError:
-                    break
-
-        logger.error('Could not get the free energy from the calculation. '
-                     'Was a frequency requested?')
-        return None
+        if free_energy is None:
+            logger.error('Could not get the free energy from the calculation. '
+                         'Was a frequency requested?')
+        return free_energy
 
     def optimisation_converged(self, calc):
+        tail = get_output_tail(calc)
 
-        for line in reversed(calc.output.file_lines):
-            if 'THE OPTIMIZATION HAS CONVERGED' in line:
-                return True
+        if b'THE OPTIMIZATION HAS CONVERGED' in tail:
+            return True
 
-        return False
+        return get_output_properties(calc)['converged']
 
     def optimisation_nearly_converged(self, calc):
-        geom_conv_block = False
-
-        for line in reversed(calc.output.file_lines):
-            if geom_conv_block and 'Geometry convergence' in line:
-                geom_conv_block = False
-            if 'The optimization has not yet converged' in line:
-                geom_conv_block = True
-            if geom_conv_block and len(line.split()) == 5:
-                if line.split()[-1] == 'YES':
-                    return True
-
-        return False
+        return get_output_properties(calc)['nearly_converged']
 
     def get_imaginary_freqs(self, calc):
-        imag_freqs = []
-
-        for i, line in enumerate(calc.output.file_lines):
-            if 'VIBRATIONAL FREQUENCIES' in line:
-                last_line = i + 3 * calc.molecule.n_atoms + 5
-
-                # Reset every time freqs are found, so the final is returned
-                freq_lines = calc.output.file_lines[i + 5:last_line]
-                freqs = [float(l.split()[1]) for l in freq_lines]
-                imag_freqs = [freq for freq in freqs if freq < 0]
+        imag_freqs = list(get_output_properties(calc)['imag_freqs'])
 
         logger.info(f'Found imaginary freqs {imag_freqs}')
         return imag_freqs
 
     def get_normal_mode_displacements(self, calc, mode_number):
-        normal_mode_section, values_sec, = False, False
-        displacements, col = [], None
-
-        for j, line in enumerate(calc.output.file_lines):
-            if 'NORMAL MODES' in line:
-                normal_mode_section, values_sec, = True, False
-                displacements, col = [], None
-
-            if 'IR SPECTRUM' in line:
-                normal_mode_section, values_sec = False, False
-
-            if normal_mode_section and len(line.split()) > 1:
-                if line.split()[0].startswith('0'):
-                    values_sec = True
+        normal_modes = get_output_properties(calc)['normal_modes']
 
-            if not values_sec:
-                continue
+        if mode_number not in normal_modes:
+            return np.array([])
 
-            if '.' in line or len(line.split()) < 2:
-                continue
-
-            mode_numbers = [int(val) for val in line.split()]
-            if mode_number not in mode_numbers:
-                continue
-
-            col = [i for i in range(len(mode_numbers)) if mode_number == mode_numbers[i]][0] + 1
-
-            d_lines = calc.output.file_lines[j+1:j+3 * calc.molecule.n_atoms+1]
-            displacements = [float(d_line.split()[col]) for d_line in d_lines]
-
-        displacements_xyz = [displacements[i:i + 3] for i in range(0, len(displacements), 3)]
-
-        return np.array(displacements_xyz)
+        # Copy so the cached displacements are not modified
+        return np.array(normal_modes[mode_number]).reshape(-1, 3)
 
     def get_final_atoms(self, calc):
 
-        atoms = []
         xyz_file_name = calc.output.filename.replace('.out', '.xyz')
 
         if not os.path.exists(xyz_file_name):
             raise NoCalculationOutput
 
-        with open(xyz_file_name, 'r') as xyz_file:
-            for line_no, line in enumerate(xyz_file):
-                if line_no > 1:
-                    atom_label, x, y, z = line.split()
-                    atoms.append(Atom(atom_label, x=x, y=y, z=z))
+        # Parse the whole file in one go, skipping the number of atoms and
+        # title lines. A failed calculation may leave an empty file, which
+        # has no atoms rather than being worth a warning
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=UserWarning)
+            xyz_data = np.loadtxt(xyz_file_name, skiprows=2, ndmin=1,
+                                  dtype=[('label', 'U3'), ('coord', 'f8', 3)])
 
-        return atoms
+        return [Atom(label, *coord)
+                for label, coord in zip(xyz_data['label'].tolist(),
+                                        xyz_data['coord'].tolist())]
 
     def get_atomic_charges(self, calc):
         """
@@ -437,16 +741,7 @@ class ORCA(ElectronicStructureMethod):
            0 C   -0.006954    0.000000
            . .      .            .
         """
-        charges = []
-
-        for i, line in enumerate(calc.output.file_lines):
-            if 'HIRSHFELD ANALYSIS' in line:
-                charges = []
-                first, last = i+7, i+7+calc.molecule.n_atoms
-                for charge_line in calc.output.file_lines[first:last]:
-                    charges.append(float(charge_line.split()[-1]))
-
-        return charges
+        return list(get_output_properties(calc)['charges'])
 
     def get_gradients(self, calc):
         """
@@ -458,21 +753,10 @@ class ORCA(ElectronicStructureMethod):
 
            1   C   :   -0.011390275   -0.000447412    0.000552736    <- j
         """
-        gradients = []
-
-        for i, line in enumerate(calc.output.file_lines):
-            if 'CARTESIAN GRADIENT' in line:
-                gradients = []
-                first, last = i + 3, i + 3 + calc.molecule.n_atoms
-                for grad_line in calc.output.file_lines[first:last]:
-                    dadx, dady, dadz = grad_line.split()[-3:]
-                    vec = [float(dadx), float(dady), float(dadz)]
-
-                    gradients.append(np.array(vec))
+        gradients = np.array(get_output_properties(calc)['gradients'])
 
         # Convert from Ha a0^-1 to Ha A-1
-        gradients = [grad / Constants.a02ang for grad in gradients]
-        return np.array(gradients)
+        return gradients / Constants.a02ang
 
     def __init__(self):
         super().__init__('orca', path=Config.ORCA.path,
@@ -306,8 +306,9 @@ class XTB(ElectronicStructureMethod):
                         gradients.append(np.array(vec))
 
             with open(f'{calc.name}_xtb.grad', 'w') as new_grad_file:
-                [print('{:^12.8f} {:^12.8f} {:^12.8f}'.format(*line),
-                       file=new_grad_file) for line in gradients]
+                for line in gradients:
+                    print('{:^12.8f} {:^12.8f} {:^12.8f}'.format(*line),
+                          file=new_grad_file)
             os.remove('gradient')
 
         # Convert from Ha a0^-1 to Ha A-1
@@ -1,15 +1,22 @@
 from autode.pes.pes_1d import get_ts_guess_1d, PES1d
+from autode.pes.pes_1d import get_prominent_peaks_numpy
+from autode.pes.pes_1d import get_prominent_peaks_loop
+from autode.pes.pes_1d import get_prominent_peaks
+from autode.pes.pes_1d import get_scan_key
 from autode.atoms import Atom
 from autode.species.molecule import Molecule
 from autode.pes.pes import FormingBond
 from autode.species.complex import ReactantComplex, ProductComplex
 from autode.config import Config
+from autode.exceptions import FitFailed
 from autode.wrappers.ORCA import orca
 from autode.wrappers.XTB import xtb
 from autode.wrappers.keywords import OptKeywords
 from . import testutils
 from autode.utils import work_in
+from autode.units import KcalMol
 import numpy as np
+import pytest
 import os
 
 here = os.path.dirname(os.path.abspath(__file__))
@@ -89,3 +96,157 @@ def test_1d_pes():
     pes.print_plot(method_name='orca', name='H+H2_H2+H')
     assert os.path.exists('H+H2_H2+H.png')
     os.remove('H+H2_H2+H.png')
+
+
+def test_1d_pes_saddle_points():
+
+    pes = PES1d(reactant=reac, product=prod, rs=np.linspace(1.0, 0.7, 7),
+                r_idxs=(1, 2))
+
+    # Two peaks at indexes 2 and 4, the latter being the highest in energy
+    for i, energy in enumerate([0.0, 0.01, 0.02, 0.01, 0.03, 0.0, -0.01]):
+        pes.species[i] = hydrogen.copy()
+        pes.species[i].energy = energy
+
+    peaks = list(pes.get_species_saddle_point())
+    assert len(peaks) == 2
+    assert peaks[0].energy == 0.03
+    assert peaks[1].energy == 0.02
+
+    # Peaks less prominent than h_star are not saddle points
+    peaks = list(pes.get_species_saddle_point(h_star=0.015))
+    assert len(peaks) == 1
+    assert peaks[0].energy == 0.03
+
+    # and a small noisy bump close to a large barrier is excluded
+    pes.species[1].energy = 0.02
+    pes.species[2].energy = 0.0201
+    pes.species[3].energy = 0.02
+    peaks = list(pes.get_species_saddle_point(h_star=1.0/KcalMol.conversion))
+    assert len(peaks) == 1
+    assert peaks[0].energy == 0.03
+
+    # but by default all peaks are possible saddle points
+    assert len(list(pes.get_species_saddle_point())) == 2
+
+
+def test_1d_pes_smooth_barrier():
+
+    rs = np.arange(1.0, 3.0, 0.1)
+    pes = PES1d(reactant=reac, product=prod, rs=rs, r_idxs=(1, 2))
+
+    # A smooth 15 kcal mol-1 barrier 0.5 Å wide is much more prominent than
+    # the change in energy between neighbouring points
+    energies = (15.0 / KcalMol.conversion) / np.cosh((rs - 2.0) / 0.5)**2
+
+    for i, energy in enumerate(energies):
+        pes.species[i] = hydrogen.copy()
+        pes.species[i].energy = energy
+
+    peaks = list(pes.get_species_saddle_point())
+    assert len(peaks) == 1
+    assert peaks[0].energy == np.max(energies)
+
+
+def test_1d_pes_degenerate_scan():
+
+    # Too few points on the surface to find a peak
+    fbond = FormingBond(atom_indexes=(1, 2), species=reac)
+    fbond.final_dist = fbond.curr_dist - 0.15
+
+    assert get_ts_guess_1d(name='H+H2_H2+H', reactant=reac, product=prod,
+                           bond=fbond, method=orca, keywords=opt_keywords,
+                           dr=0.1) is None
+
+    # and a non-finite final distance
+    fbond.final_dist = np.inf
+    assert get_ts_guess_1d(name='H+H2_H2+H', reactant=reac, product=prod,
+                           bond=fbond, method=orca, keywords=opt_keywords,
+                           dr=0.1) is None
+
+
+def test_prominent_peaks():
+
+    energies = np.array([0.0, 0.01, 0.02, 0.01, 0.03, 0.0, -0.01, 0.0])
+
+    # The compiled version used when numba is available should match both
+    for func in (get_prominent_peaks_numpy, get_prominent_peaks_loop,
+                 get_prominent_peaks):
+        assert list(func(energies, 0.0, 1)) == [2, 4]
+        assert list(func(energies, 0.015, 1)) == [4]
+        assert list(func(energies, 0.025, 2)) == [4]
+        assert len(func(energies, 0.1, 1)) == 0
+        assert len(func(np.array([]), 0.0, 1)) == 0
+
+
+def test_1d_pes_initial_species():
+
+    pes = PES1d(reactant=reac, product=prod, rs=np.linspace(1.0, 0.7, 4),
+                r_idxs=(1, 2))
+
+    initial_species = pes._get_initial_species()
+    assert len(initial_species) == 4
+
+    for r, species in zip(pes.rs[:, 0], initial_species):
+        assert np.isclose(species.get_distance(1, 2), r)
+
+        # Only the atoms in the scanned bond are shifted
+        assert np.allclose(species.atoms[0].coord, reac.atoms[0].coord)
+
+    # and the reactant is unchanged
+    assert np.isclose(reac.get_distance(1, 2), 1.0)
+
+
+def test_1d_pes_failed_point():
+
+    pes = PES1d(reactant=reac, product=prod, rs=np.linspace(1.0, 0.7, 4),
+                r_idxs=(1, 2))
+    pes.species[0].energy = -1.5
+
+    # Interpolated structures don't have the energy of the first point
+    initial_species = pes._get_initial_species()
+    assert all(species.energy is None for species in initial_species)
+    assert all(species.graph is None for species in initial_species)
+    assert reac.energy is None
+
+    # so a point that failed to optimise can't be used to find a peak
+    for i, energy in enumerate([-1.5, None, -1.48, -1.5]):
+        pes.species[i] = initial_species[i]
+        pes.species[i].energy = energy
+
+    with pytest.raises(FitFailed):
+        _ = list(pes.get_species_saddle_point())
+
+    # but is replaced by the closest point that did optimise, the previous
+    # one if both neighbours are equally close
+    pes._fill_failed_points()
+    assert pes.species[1].energy == -1.5
+    assert np.isclose(pes.species[1].get_distance(1, 2), pes.rs[0][0])
+
+    peaks = list(pes.get_species_saddle_point())
+    assert len(peaks) == 1
+    assert peaks[0].energy == -1.48
+
+    # and if no points succeeded the surface can't be used
+    for species in pes.species:
+        species.energy = None
+
+    pes._fill_failed_points()
+    with pytest.raises(FitFailed):
+        _ = list(pes.get_species_saddle_point())
+
+
+def test_scan_key(monkeypatch):
+
+    fbond = FormingBond(atom_indexes=(1, 2), species=reac)
+
+    def key():
+        return get_scan_key(reac, prod, fbond, name='H+H2_H2+H', method=orca,
+                            keywords=opt_keywords)
+
+    key_cpcm = key()
+    assert key() == key_cpcm
+
+    # Changing how the method treats solvent changes the result of the scan
+    monkeypatch.setattr(orca, 'implicit_solvation_type', 'smd')
+    assert key() != key_cpcm
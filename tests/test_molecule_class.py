@@ -35,6 +35,19 @@ def test_basic_attributes():
     assert methane.mult == 1
     assert isinstance(methane.rdkit_mol_obj, Mol)
 
+    # Deep copies should have independent RDKit molecules, graphs and atoms
+    methane_copy = methane.copy()
+    assert isinstance(methane_copy.rdkit_mol_obj, Mol)
+    assert methane_copy.rdkit_mol_obj is not methane.rdkit_mol_obj
+    assert methane_copy.rdkit_mol_obj.GetNumAtoms() == 5
+    assert methane_copy.rdkit_mol_obj.GetNumConformers() == 1
+
+    assert methane_copy.graph is not methane.graph
+    assert methane_copy.graph.number_of_edges() == 4
+
+    methane_copy.atoms[0].translate(np.ones(3))
+    assert np.linalg.norm(methane.atoms[0].coord - methane_copy.atoms[0].coord) > 1
+
     # A molecule without a name should default to the formula
     methane = Molecule(smiles='C')
     assert methane.name == 'CH4' or methane.name == 'H4C'
@@ -1,6 +1,7 @@
 from autode.wrappers.ORCA import ORCA
 from autode.atoms import Atom
 from autode.wrappers.ORCA import calc_atom_entropy
+from autode.wrappers.ORCA import get_output_properties
 from autode.calculation import Calculation
 from autode.calculation import execute_calc
 from autode.species.molecule import Molecule
@@ -224,3 +225,84 @@ def test_calc_entropy():
 
     # Ensure the calculated and 'actual' from Gaussian09 are close
     assert np.abs(f_entropy_g09 - f_entropy) < 2E-5
+
+
+@testutils.work_in_zipped_dir(os.path.join(here, 'data', 'orca.zip'))
+def test_output_properties_cached():
+
+    calc = Calculation(name='opt', molecule=test_mol, method=method,
+                       keywords=opt_keywords)
+    calc.output.filename = 'opt_orca.out'
+    calc.output.set_lines()
+
+    props = get_output_properties(calc)
+    assert props['terminated_normally']
+    assert -499.735 < props['energy'] < -499.730
+    assert method.calculation_terminated_normally(calc)
+
+    # Parsing the same output lines again should use the cached result
+    assert get_output_properties(calc) is props
+
+    # while setting the output lines again requires them to be parsed again
+    with open('opt_orca.out', 'a') as out_file:
+        print('\n' * 50, file=out_file)
+    calc.output.set_lines()
+
+    new_props = get_output_properties(calc)
+    assert new_props is not props
+    assert not new_props['terminated_normally']
+
+    # Termination is only checked in the final lines of the output, while the
+    # energy is still available
+    assert not method.calculation_terminated_normally(calc)
+    assert -499.735 < method.get_energy(calc) < -499.730
+
+    # as does setting the lines directly
+    calc.output.file_lines = calc.output.file_lines[:-50]
+    assert get_output_properties(calc)['terminated_normally']
+
+    # and the file on disk is not used once the lines are set
+    os.remove('opt_orca.out')
+    assert method.optimisation_converged(calc)
+
+
+def test_single_atom_opt_keywords(tmpdir):
+    os.chdir(tmpdir)
+
+    h = Molecule(name='H', atoms=[Atom('H')], mult=2)
+    calc = Calculation(name='h_opt', molecule=h, method=method,
+                       keywords=OptKeywords(['Opt', 'LooseOpt', 'PBE',
+                                             'def2-SVP']))
+    calc.generate_input()
+
+    # Neither optimisation keyword should be in the input for a single atom
+    keyword_line = open('h_opt_orca.inp', 'r').readline().lower()
+    assert 'opt' not in keyword_line
+    assert 'pbe' in keyword_line
+
+    os.chdir(here)
+
+
+def test_solvent_keyword(tmpdir):
+    os.chdir(tmpdir)
+
+    # Ethyl acetate is an SMD but not a CPCM solvent in ORCA
+    methane = Molecule(name='methane', smiles='C',
+                       solvent_name='ethyl acetate')
+
+    method.implicit_solvation_type = 'SMD'
+    calc = Calculation(name='methane_smd_etoac', molecule=methane,
+                       method=method, keywords=sp_keywords)
+    calc.generate_input()
+
+    inp_lines = open('methane_smd_etoac_orca.inp', 'r').readlines()
+    assert 'cpcm' in inp_lines[0].lower()
+    assert any('smdsolvent' in line.lower() for line in inp_lines)
+
+    with pytest.raises(UnsuppportedCalculationInput):
+        method.implicit_solvation_type = 'CPCM'
+        calc = Calculation(name='methane_cpcm_etoac', molecule=methane,
+                           method=method, keywords=sp_keywords)
+        calc.generate_input()
+
+    os.chdir(here)
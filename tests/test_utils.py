@@ -106,3 +106,34 @@ def test_conformers():
     # Populating a species conformers should allow this function to be called
     methane.conformers = [Conformer(name='conf0', atoms=methane.atoms)]
     test(methane)
+
+
+def test_cached_on_disk(tmpdir, monkeypatch):
+
+    n_calls = []
+
+    @utils.cached_on_disk(key_func=lambda x: x)
+    def square(x):
+        n_calls.append(x)
+        return x**2 if x >= 0 else None
+
+    # Without $AUTODE_CACHE_DIR nothing is cached
+    monkeypatch.delenv('AUTODE_CACHE_DIR', raising=False)
+    assert square(2) == 4
+    assert square(2) == 4
+    assert len(n_calls) == 2
+
+    monkeypatch.setenv('AUTODE_CACHE_DIR', str(tmpdir))
+    n_calls.clear()
+
+    assert square(2) == 4
+    assert square(2) == 4
+    assert square(3) == 9
+    assert n_calls == [2, 3]
+    assert len(os.listdir(str(tmpdir))) == 2
+
+    # Failed calls, which return None, are not cached
+    assert square(-1) is None
+    assert square(-1) is None
+    assert n_calls == [2, 3, -1, -1]
+    assert len(os.listdir(str(tmpdir))) == 2